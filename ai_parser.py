@@ -1,364 +1,1039 @@
-"""
-CTF Sentinel - AI/NLP Processing Module
-
-This module handles Named Entity Recognition (NER) using spaCy, including custom
-pattern matching for CTF-specific entities like flags, API keys, and file paths.
-
-Author: CTF Sentinel Team
-Version: 1.0.0
-"""
-
-import re
-from typing import Dict, List, Tuple, Optional
-import spacy
-from spacy.language import Language
-from spacy.matcher import Matcher
-from spacy.tokens import Doc, Span
-from rich.console import Console
-
-console = Console()
-
-
-class AIParser:
-    """
-    AI-powered entity extraction and analysis using spaCy NLP.
-    
-    This class provides Named Entity Recognition (NER) with custom patterns
-    for CTF-specific entities like flags, API keys, credentials, and file paths.
-    
-    Attributes:
-        nlp (Language): spaCy language model.
-        matcher (Matcher): spaCy pattern matcher for custom entities.
-        verbose (bool): Enable verbose logging.
-    """
-    
-    def __init__(self, model: str = "en_core_web_sm", verbose: bool = False):
-        """
-        Initialize the AI Parser with spaCy model and custom patterns.
-        
-        Args:
-            model (str): spaCy model to load (default: en_core_web_sm).
-            verbose (bool): Enable verbose output.
-        
-        Raises:
-            OSError: If spaCy model is not installed.
-        """
-        self.verbose = verbose
-        
-        try:
-            if self.verbose:
-                console.print(f"[dim]Loading spaCy model: {model}...[/dim]")
-            self.nlp = spacy.load(model)
-        except OSError:
-            console.print(f"[red]✗ spaCy model '{model}' not found.[/red]")
-            console.print(f"[yellow]Run: python -m spacy download {model}[/yellow]")
-            raise
-        
-        # Initialize custom matcher
-        self.matcher = Matcher(self.nlp.vocab)
-        self._setup_custom_patterns()
-        
-        if self.verbose:
-            console.print("[green]✓[/green] AI Parser initialized")
-    
-    def _setup_custom_patterns(self):
-        """
-        Set up custom pattern matching rules for CTF-specific entities.
-        
-        Defines patterns for:
-        - CTF flags (various formats)
-        - API keys and tokens
-        - File paths
-        - Credentials
-        - IP addresses
-        - URLs
-        - Hashes
-        """
-        # CTF Flag patterns
-        flag_patterns = [
-            # Standard CTF{...} format
-            [{"TEXT": {"REGEX": r"CTF\{[^}]+\}"}}],
-            [{"TEXT": {"REGEX": r"flag\{[^}]+\}"}}],
-            [{"TEXT": {"REGEX": r"FLAG\{[^}]+\}"}}],
-            # Other common formats
-            [{"TEXT": {"REGEX": r"[A-Z]{2,10}\{[^}]{10,}\}"}}],
-        ]
-        
-        # API Key patterns
-        api_key_patterns = [
-            # AWS keys
-            [{"TEXT": {"REGEX": r"AKIA[0-9A-Z]{16}"}}],
-            # Generic API keys
-            [{"TEXT": {"REGEX": r"api[_-]?key[=:]\s*['\"]?[a-zA-Z0-9]{20,}['\"]?"}}],
-            [{"TEXT": {"REGEX": r"token[=:]\s*['\"]?[a-zA-Z0-9]{20,}['\"]?"}}],
-            # GitHub tokens
-            [{"TEXT": {"REGEX": r"ghp_[a-zA-Z0-9]{36}"}}],
-            [{"TEXT": {"REGEX": r"gho_[a-zA-Z0-9]{36}"}}],
-        ]
-        
-        # File path patterns
-        file_path_patterns = [
-            # Unix paths
-            [{"TEXT": {"REGEX": r"/etc/[a-z]+(/[a-z._-]+)*"}}],
-            [{"TEXT": {"REGEX": r"/var/[a-z]+(/[a-z._-]+)*"}}],
-            [{"TEXT": {"REGEX": r"/home/[a-z]+(/[a-z._-]+)*"}}],
-            [{"TEXT": {"REGEX": r"~/.ssh/[a-z._-]+"}}],
-            # Windows paths
-            [{"TEXT": {"REGEX": r"[A-Z]:\\[^<>:\"|?*\n]+"}}],
-        ]
-        
-        # Credential patterns
-        credential_patterns = [
-            # Username:password
-            [{"TEXT": {"REGEX": r"[a-zA-Z0-9_-]+:[a-zA-Z0-9!@#$%^&*]{8,}"}}],
-            # Password fields
-            [{"TEXT": {"REGEX": r"pass(word)?[=:]\s*['\"]?[a-zA-Z0-9!@#$%^&*]{6,}['\"]?"}}],
-        ]
-        
-        # Register patterns with matcher
-        self.matcher.add("CTF_FLAG", flag_patterns)
-        self.matcher.add("API_KEY", api_key_patterns)
-        self.matcher.add("FILE_PATH", file_path_patterns)
-        self.matcher.add("CREDENTIAL", credential_patterns)
-        
-        if self.verbose:
-            console.print("[dim]Custom NER patterns loaded[/dim]")
-    
-    def _extract_regex_entities(self, text: str) -> List[Dict[str, str]]:
-        """
-        Extract entities using regex patterns (backup method).
-        
-        This method provides regex-based extraction for entities that might
-        be missed by spaCy's pattern matcher.
-        
-        Args:
-            text (str): Input text to analyze.
-        
-        Returns:
-            List[Dict[str, str]]: List of extracted entities with type and value.
-        """
-        entities = []
-        
-        # Regex patterns for various entities
-        patterns = {
-            'EMAIL': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-            'IP_ADDRESS': r'\b(?:\d{1,3}\.){3}\d{1,3}\b',
-            'URL': r'https?://[^\s<>"{}|\\^`\[\]]+',
-            'MD5_HASH': r'\b[a-fA-F0-9]{32}\b',
-            'SHA1_HASH': r'\b[a-fA-F0-9]{40}\b',
-            'SHA256_HASH': r'\b[a-fA-F0-9]{64}\b',
-            'SUBDOMAIN': r'\b[a-z0-9]([a-z0-9-]*[a-z0-9])?(\.[a-z0-9]([a-z0-9-]*[a-z0-9])?)*\.[a-z]{2,}\b',
-            'PORT': r'\bport[:\s]+(\d{1,5})\b',
-        }
-        
-        for entity_type, pattern in patterns.items():
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                entities.append({
-                    'type': entity_type,
-                    'value': match.group(0),
-                    'start': match.start(),
-                    'end': match.end()
-                })
-        
-        return entities
-    
-    def extract_entities(self, text: str, source: str = "unknown") -> List[Dict[str, any]]:
-        """
-        Extract all entities from text using spaCy NER and custom patterns.
-        
-        This is the main entity extraction method combining:
-        - spaCy's built-in NER
-        - Custom pattern matching
-        - Regex-based extraction
-        
-        Args:
-            text (str): Input text to analyze.
-            source (str): Source identifier for provenance tracking.
-        
-        Returns:
-            List[Dict[str, any]]: List of extracted entities with metadata.
-        """
-        if not text or len(text.strip()) == 0:
-            return []
-        
-        entities = []
-        
-        # Limit text length to avoid performance issues
-        max_length = 1000000  # 1MB
-        if len(text) > max_length:
-            text = text[:max_length]
-            if self.verbose:
-                console.print(f"[yellow]Warning: Text truncated to {max_length} chars[/yellow]")
-        
-        # Process with spaCy
-        doc = self.nlp(text)
-        
-        # Extract standard NER entities
-        for ent in doc.ents:
-            entities.append({
-                'type': ent.label_,
-                'value': ent.text,
-                'start': ent.start_char,
-                'end': ent.end_char,
-                'source': source,
-                'method': 'spacy_ner'
-            })
-        
-        # Extract custom pattern matches
-        matches = self.matcher(doc)
-        for match_id, start, end in matches:
-            label = self.nlp.vocab.strings[match_id]
-            span = doc[start:end]
-            entities.append({
-                'type': label,
-                'value': span.text,
-                'start': span.start_char,
-                'end': span.end_char,
-                'source': source,
-                'method': 'pattern_match'
-            })
-        
-        # Extract regex-based entities
-        regex_entities = self._extract_regex_entities(text)
-        for ent in regex_entities:
-            ent['source'] = source
-            ent['method'] = 'regex'
-            entities.append(ent)
-        
-        # Remove duplicates (same value and type)
-        unique_entities = []
-        seen = set()
-        for ent in entities:
-            key = (ent['type'], ent['value'])
-            if key not in seen:
-                seen.add(key)
-                unique_entities.append(ent)
-        
-        if self.verbose:
-            console.print(f"[dim]Extracted {len(unique_entities)} unique entities from {source}[/dim]")
-        
-        return unique_entities
-    
-    def analyze_sentiment(self, text: str) -> Dict[str, float]:
-        """
-        Perform basic sentiment analysis on text.
-        
-        This is a placeholder for sentiment analysis. For production use,
-        integrate libraries like VADER, TextBlob, or transformers.
-        
-        Args:
-            text (str): Text to analyze.
-        
-        Returns:
-            Dict[str, float]: Sentiment scores (positive, neutral, negative).
-        """
-        # Placeholder implementation
-        # In production, use VADER or similar
-        return {
-            'positive': 0.0,
-            'neutral': 1.0,
-            'negative': 0.0,
-            'compound': 0.0
-        }
-    
-    def extract_relationships(
-        self,
-        entities: List[Dict[str, any]]
-    ) -> List[Tuple[Dict, Dict, str]]:
-        """
-        Extract relationships between entities.
-        
-        Identifies potential connections between discovered entities
-        based on co-occurrence and context.
-        
-        Args:
-            entities (List[Dict]): List of extracted entities.
-        
-        Returns:
-            List[Tuple]: List of (entity1, entity2, relationship_type) tuples.
-        """
-        relationships = []
-        
-        # Simple co-occurrence based relationship detection
-        # Group entities by source
-        by_source = {}
-        for ent in entities:
-            source = ent.get('source', 'unknown')
-            if source not in by_source:
-                by_source[source] = []
-            by_source[source].append(ent)
-        
-        # Find relationships within same source
-        for source, source_entities in by_source.items():
-            for i, ent1 in enumerate(source_entities):
-                for ent2 in source_entities[i+1:]:
-                    # Check if entities are close in text
-                    if abs(ent1.get('start', 0) - ent2.get('start', 0)) < 1000:
-                        relationships.append((ent1, ent2, 'co_occurrence'))
-        
-        return relationships
-    
-    def score_entity_importance(self, entity: Dict[str, any]) -> float:
-        """
-        Calculate an importance score for an entity.
-        
-        Higher scores indicate entities more likely to be relevant for CTF.
-        
-        Args:
-            entity (Dict): Entity to score.
-        
-        Returns:
-            float: Importance score (0.0 to 1.0).
-        """
-        score = 0.5  # Base score
-        
-        entity_type = entity.get('type', '')
-        
-        # CTF-specific entities get highest priority
-        if entity_type in ['CTF_FLAG', 'API_KEY', 'CREDENTIAL']:
-            score = 1.0
-        
-        # Technical entities get high priority
-        elif entity_type in ['IP_ADDRESS', 'URL', 'FILE_PATH', 'EMAIL']:
-            score = 0.8
-        
-        # Named entities get medium priority
-        elif entity_type in ['PERSON', 'ORG', 'GPE']:
-            score = 0.6
-        
-        # Hashes get medium-high priority
-        elif 'HASH' in entity_type:
-            score = 0.75
-        
-        return score
-    
-    def filter_noise(
-        self,
-        entities: List[Dict[str, any]],
-        min_score: float = 0.3
-    ) -> List[Dict[str, any]]:
-        """
-        Filter out low-value entities (noise reduction).
-        
-        Args:
-            entities (List[Dict]): Entities to filter.
-            min_score (float): Minimum importance score threshold.
-        
-        Returns:
-            List[Dict]: Filtered entities above threshold.
-        """
-        filtered = []
-        
-        for entity in entities:
-            score = self.score_entity_importance(entity)
-            entity['importance_score'] = score
-            
-            if score >= min_score:
-                filtered.append(entity)
-        
-        if self.verbose:
-            removed = len(entities) - len(filtered)
-            console.print(f"[dim]Filtered out {removed} low-value entities[/dim]")
-        
-        return filtered
+"""
+CTF Sentinel - AI/NLP Processing Module
+
+This module handles Named Entity Recognition (NER) using spaCy, including custom
+pattern matching for CTF-specific entities like flags, API keys, and file paths.
+
+Author: CTF Sentinel Team
+Version: 1.0.0
+"""
+
+import functools
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+from itertools import compress, groupby
+from operator import itemgetter
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional
+import numpy as np
+import spacy
+from spacy.errors import Errors
+from spacy.language import Language
+from spacy.tokens import Doc, Span
+from rich.console import Console
+
+from config import ENTITY_PRIORITIES, ENTITY_PRIORITY_TABLE, SPACY_MODEL, SPACY_MODEL_ALIASES, EntityType
+
+try:
+    # Optional: google-re2 matches in linear time and is immune to ReDoS.
+    # Its \b, \d and \s are ASCII-only, so it is used for ASCII text only
+    # and Python's Unicode-aware re handles everything else.
+    import re2 as _regex_engine
+except ImportError:
+    _regex_engine = re
+
+console = Console()
+
+# Pipeline components whose output is never read (only doc.ents is consumed)
+_UNUSED_COMPONENTS = ("tagger", "parser", "attribute_ruler", "lemmatizer")
+
+# Large texts are fed to spaCy in pieces of about this many characters
+_CHUNK_SIZE = 50000
+
+# Smallest nlp.pipe batch that keeps spaCy's internal minibatcher saturated
+_MIN_BATCH_SIZE = 32
+
+# Extraction results for previously seen content, one JSON file per text
+_NER_CACHE_DIR = Path.home() / '.ctf_sentinel' / 'ner_cache'
+
+# Regex patterns for the backup extraction pass, compiled once at import time
+# (case-insensitivity is inlined, and only where letters need it, so each
+# pattern works with either engine)
+_REGEX_PATTERNS = {
+    'EMAIL': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
+    'IP_ADDRESS': r'\b(?:\d{1,3}\.){3}\d{1,3}\b',
+    'URL': r'(?i)https?://[^\s<>"{}|\\^`\[\]]+',
+    # MD5, SHA-1 and SHA-256 in one scan; the match length gives the type
+    'HASH': r'\b(?:[a-fA-F0-9]{64}|[a-fA-F0-9]{40}|[a-fA-F0-9]{32})\b',
+    # Label and depth bounds keep backtracking linear on hostile input
+    'SUBDOMAIN': (
+        r'(?i)\b[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?'
+        r'(?:\.[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?){0,10}\.[a-z]{2,24}\b'
+    ),
+    'PORT': r'(?i)\bport[:\s]+(\d{1,5})\b',
+}
+_REGEX_ENTITIES = tuple(
+    (entity_type, _regex_engine.compile(pattern))
+    for entity_type, pattern in _REGEX_PATTERNS.items()
+)
+# The same patterns compiled with re, for non-ASCII text
+_UNICODE_REGEX_ENTITIES = _REGEX_ENTITIES if _regex_engine is re else tuple(
+    (entity_type, re.compile(pattern))
+    for entity_type, pattern in _REGEX_PATTERNS.items()
+)
+
+# Hash type by digest length, in the order hashes are reported
+_HASH_TYPES = {32: 'MD5_HASH', 40: 'SHA1_HASH', 64: 'SHA256_HASH'}
+
+# Entity types that cannot match text without a digit
+_NUMERIC_ENTITIES = frozenset({'IP_ADDRESS', 'PORT'})
+_DIGIT_RX = re.compile(r'\d')
+
+
+def _build_regex_set():
+    """
+    Compile all regex entity patterns into one RE2 multi-pattern set.
+    
+    Returns:
+        Optional[re2.Set]: Set reporting which patterns occur in a text in a
+            single linear pass, or None when RE2 is not installed.
+    """
+    if _regex_engine is re:
+        return None
+    
+    regex_set = _regex_engine.Set.SearchSet()
+    for pattern in _REGEX_PATTERNS.values():
+        regex_set.Add(pattern)
+    regex_set.Compile()
+    return regex_set
+
+
+_REGEX_SET = _build_regex_set()
+
+# Custom patterns for CTF-specific entities, in match priority order; each
+# carries a literal that any match must contain so absent ones can be skipped
+_CUSTOM_PATTERNS = (
+    # CTF Flag patterns
+    ('CTF_FLAG', 'CTF{', r"CTF\{[^}]+\}"),
+    ('CTF_FLAG', 'flag{', r"flag\{[^}]+\}"),
+    ('CTF_FLAG', 'FLAG{', r"FLAG\{[^}]+\}"),
+    ('CTF_FLAG', '{', r"[A-Z]{2,10}\{[^}]{10,}\}"),
+    # API Key patterns (AWS, generic, GitHub)
+    ('API_KEY', 'AKIA', r"AKIA[0-9A-Z]{16}"),
+    ('API_KEY', 'api', r"api[_-]?key[=:]\s*['\"]?[a-zA-Z0-9]{20,}['\"]?"),
+    ('API_KEY', 'token', r"token[=:]\s*['\"]?[a-zA-Z0-9]{20,}['\"]?"),
+    ('API_KEY', 'ghp_', r"ghp_[a-zA-Z0-9]{36}"),
+    ('API_KEY', 'gho_', r"gho_[a-zA-Z0-9]{36}"),
+    # File path patterns (Unix, Windows)
+    ('FILE_PATH', '/etc/', r"/etc/[a-z]+(?:/[a-z._-]+)*"),
+    ('FILE_PATH', '/var/', r"/var/[a-z]+(?:/[a-z._-]+)*"),
+    ('FILE_PATH', '/home/', r"/home/[a-z]+(?:/[a-z._-]+)*"),
+    ('FILE_PATH', '~/.ssh/', r"~/.ssh/[a-z._-]+"),
+    ('FILE_PATH', ':\\', r"[A-Z]:\\[^<>:\"|?*\s]+"),
+    # Credential patterns (username:password, password fields)
+    ('CREDENTIAL', ':', r"[a-zA-Z0-9_-]+:[a-zA-Z0-9!@#$%^&*]{8,}"),
+    ('CREDENTIAL', 'pass', r"pass(?:word)?[=:]\s*['\"]?[a-zA-Z0-9!@#$%^&*]{6,}['\"]?"),
+)
+
+# Custom patterns are fused into one alternation so the text is scanned once;
+# each alternative is a named group that maps back to its entity label
+_CUSTOM_PATTERN_LABELS = {
+    f"{label}_{i}": label for i, (label, _, _) in enumerate(_CUSTOM_PATTERNS)
+}
+
+@functools.lru_cache(maxsize=64)
+def _compile_custom_patterns(indices: Tuple[int, ...], engine=_regex_engine) -> re.Pattern:
+    """
+    Compile the fused alternation of the selected custom patterns.
+    
+    Uses RE2 by default when installed, so the single pass over the text
+    runs in linear time however the alternatives overlap.
+    
+    Args:
+        indices (Tuple[int, ...]): Positions in _CUSTOM_PATTERNS, in order.
+        engine: Regex module to compile with (re2 or re).
+    
+    Returns:
+        re.Pattern: Alternation with one named group per pattern.
+    """
+    return engine.compile('|'.join(
+        f"(?P<{_CUSTOM_PATTERNS[i][0]}_{i}>{_CUSTOM_PATTERNS[i][2]})" for i in indices
+    ))
+
+
+def _custom_pattern_rx(text: str) -> Optional[re.Pattern]:
+    """
+    Select the custom patterns that can match text.
+    
+    A pattern whose required literal is missing from text cannot match, so
+    it is left out of the alternation. Dropping it does not change which
+    match the remaining alternatives produce.
+    
+    Args:
+        text (str): Input text to check.
+    
+    Returns:
+        Optional[re.Pattern]: Fused pattern, or None if nothing can match.
+    """
+    indices = tuple(
+        i for i, (_, literal, _) in enumerate(_CUSTOM_PATTERNS) if literal in text
+    )
+    if not indices:
+        return None
+    
+    engine = _regex_engine if text.isascii() else re
+    return _compile_custom_patterns(indices, engine)
+
+
+def _score_type(entity_type: str) -> float:
+    """
+    Look up the importance score for an entity type.
+    
+    Types listed in config.ENTITY_PRIORITIES use that score; others fall
+    back to a default.
+    
+    Args:
+        entity_type (str): Entity type label.
+    
+    Returns:
+        float: Importance score (0.0 to 1.0).
+    """
+    score = ENTITY_PRIORITIES.get(entity_type)
+    if score is not None:
+        return score
+    
+    # Unlisted hashes get medium-high priority, everything else the base score
+    return 0.75 if 'HASH' in entity_type else 0.5
+
+
+# config.ENTITY_PRIORITY_TABLE plus a final slot for unlisted types; kept
+# float64 so they equal _score_type() exactly
+_IMPORTANCE_TABLE = np.array(ENTITY_PRIORITY_TABLE + (_score_type(''),), dtype=np.float64)
+_OTHER_TYPE_ID = len(EntityType)
+
+# Fingerprint of everything besides the model that shapes extraction output;
+# mixed into NER cache keys so entries from older pattern tables are not reused
+_EXTRACTION_FINGERPRINT = hashlib.blake2b(repr((
+    _regex_engine.__name__,
+    _REGEX_PATTERNS,
+    _HASH_TYPES,
+    _CUSTOM_PATTERNS,
+    ENTITY_PRIORITIES,
+)).encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _iter_chunks(text: str, size: int = _CHUNK_SIZE) -> Iterator[Tuple[str, int]]:
+    """
+    Split text into spaCy-sized chunks, preferring newline boundaries.
+    
+    Args:
+        text (str): Text to split.
+        size (int): Maximum chunk length in characters.
+    
+    Yields:
+        Tuple[str, int]: Each chunk and its character offset within text.
+    """
+    pos, length = 0, len(text)
+    
+    while pos < length:
+        end = pos + size
+        if end < length:
+            # Break after the last newline so tokens are not cut in half
+            cut = text.rfind('\n', pos, end)
+            if cut > pos:
+                end = cut + 1
+        yield text[pos:end], pos
+        pos = end
+
+
+def _report_missing_model(model: str):
+    """
+    Tell the user how to install a spaCy model that could not be found.
+    
+    Args:
+        model (str): Resolved spaCy model name.
+    """
+    console.print(f"[red]✗ spaCy model '{model}' not found.[/red]")
+    console.print(f"[yellow]Run: python -m spacy download {model}[/yellow]")
+
+
+def _require_model(model: str) -> str:
+    """
+    Resolve a model alias and check that spaCy can load it, without loading it.
+    
+    Lets the parent process fail with the download hint before it starts
+    worker processes that would each fail to load the model.
+    
+    Args:
+        model (str): spaCy model name or alias from SPACY_MODEL_ALIASES.
+    
+    Returns:
+        str: Resolved model name.
+    
+    Raises:
+        OSError: If the model is neither an installed package nor a path.
+    """
+    model = SPACY_MODEL_ALIASES.get(model, model)
+    if model.startswith('blank:') or spacy.util.is_package(model) or Path(model).exists():
+        return model
+    
+    _report_missing_model(model)
+    raise OSError(Errors.E050.format(name=model))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_model(model: str, disable: Tuple[str, ...]) -> Language:
+    """
+    Load a spaCy pipeline, sharing it across AIParser instances.
+    
+    Loading en_core_web_sm takes on the order of a second, so parsers with the
+    same model and disabled components reuse one Language (and its Vocab).
+    
+    Args:
+        model (str): spaCy model to load.
+        disable (Tuple[str, ...]): Pipeline components to disable.
+    
+    Returns:
+        Language: Loaded spaCy pipeline.
+    
+    Raises:
+        OSError: If spaCy model is not installed.
+    """
+    return spacy.load(model, disable=disable)
+
+
+@functools.lru_cache(maxsize=256)
+def _read_cache_entry(path: Path) -> Tuple[Dict[str, any], ...]:
+    """
+    Read a cached extraction result, memoizing recent entries in-process.
+    
+    Entries are written once under a key covering the content, model and
+    extraction fingerprint, so a memoized read matches the file on disk.
+    
+    Args:
+        path (Path): Cache entry file.
+    
+    Returns:
+        Tuple[Dict[str, any], ...]: The cached entities.
+    
+    Raises:
+        OSError: If the entry is missing or unreadable.
+        ValueError: If the entry is not valid JSON.
+    """
+    entities = json.loads(path.read_text(encoding='utf-8'))
+    for ent in entities:
+        ent['type'] = sys.intern(ent['type'])
+    return tuple(entities)
+
+
+def _close_pairs(starts: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find all index pairs (i, j), i < j, whose start offsets differ by < window.
+    
+    Offsets are sorted once and each entity's partners are located with a
+    binary search, so memory stays proportional to the number of pairs
+    rather than the full N x N distance matrix.
+    
+    Args:
+        starts (np.ndarray): Start offsets, one per entity.
+        window (int): Exclusive maximum distance between paired offsets.
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Pair indices in row-major (i, j) order.
+    """
+    n = len(starts)
+    order = np.argsort(starts, kind='stable')
+    sorted_starts = starts[order]
+    
+    # Partners of sorted position p are positions p+1 .. ends[p]-1
+    ends = np.searchsorted(sorted_starts, sorted_starts + window, side='left')
+    counts = ends - np.arange(1, n + 1)
+    total = int(counts.sum())
+    
+    left = np.repeat(np.arange(n), counts)
+    offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    right = left + 1 + offsets
+    
+    # Map back to input positions and restore the nested-loop ordering
+    a, b = order[left], order[right]
+    i_idx, j_idx = np.minimum(a, b), np.maximum(a, b)
+    ordering = np.lexsort((j_idx, i_idx))
+    
+    return i_idx[ordering], j_idx[ordering]
+
+
+class AIParser:
+    """
+    AI-powered entity extraction and analysis using spaCy NLP.
+    
+    This class provides Named Entity Recognition (NER) with custom patterns
+    for CTF-specific entities like flags, API keys, credentials, and file paths.
+    
+    Attributes:
+        nlp (Language): spaCy language model.
+        model (str): Name of the loaded spaCy model.
+        disabled (Tuple[str, ...]): Pipeline components disabled at load time.
+        cache_dir (Optional[Path]): Directory of cached extraction results,
+            or None when caching is disabled.
+        verbose (bool): Enable verbose logging.
+    """
+    
+    def __init__(
+        self,
+        model: str = SPACY_MODEL,
+        verbose: bool = False,
+        disable: Iterable[str] = _UNUSED_COMPONENTS,
+        cache_dir: Optional[Path] = _NER_CACHE_DIR,
+        gpu: bool = False
+    ):
+        """
+        Initialize the AI Parser with a spaCy model.
+        
+        Args:
+            model (str): spaCy model to load, or a short alias from
+                SPACY_MODEL_ALIASES such as "sm" (default: en_core_web_sm).
+            verbose (bool): Enable verbose output.
+            disable (Iterable[str]): Pipeline components to skip at load time
+                (default: everything except tokenization and NER).
+            cache_dir (Optional[Path]): Where to cache extraction results by
+                content hash (default: ~/.ctf_sentinel/ner_cache). None
+                disables the cache.
+            gpu (bool): Run the pipeline on a CUDA GPU when one is usable,
+                falling back to the CPU otherwise.
+        
+        Raises:
+            OSError: If spaCy model is not installed.
+        """
+        model = SPACY_MODEL_ALIASES.get(model, model)
+        
+        self.verbose = verbose
+        self.model = model
+        self.disabled = tuple(disable)
+        self.cache_dir = cache_dir
+        
+        # Must happen before loading so the model's weights land on the GPU
+        if gpu and not spacy.prefer_gpu():
+            console.print("[yellow]Warning: No usable GPU found, running spaCy on CPU[/yellow]")
+        
+        try:
+            if self.verbose:
+                console.print(f"[dim]Loading spaCy model: {model}...[/dim]")
+            self.nlp = _load_model(model, self.disabled)
+        except OSError:
+            _report_missing_model(model)
+            raise
+        
+        if self.verbose:
+            console.print("[green]✓[/green] AI Parser initialized")
+    
+    @classmethod
+    def warmup(
+        cls,
+        model: str = SPACY_MODEL,
+        disable: Iterable[str] = _UNUSED_COMPONENTS
+    ) -> None:
+        """
+        Preload the shared spaCy pipeline and the full custom-pattern scan.
+        
+        Parsers created afterwards with the same model and disabled
+        components reuse both, so CI runs and long-lived services can pay
+        the start-up cost once, up front.
+        
+        Args:
+            model (str): spaCy model name or alias to load.
+            disable (Iterable[str]): Pipeline components to skip at load time.
+        
+        Raises:
+            OSError: If spaCy model is not installed.
+        """
+        nlp = _load_model(SPACY_MODEL_ALIASES.get(model, model), tuple(disable))
+        # One tiny document triggers the pipeline's lazy initialization
+        nlp("warmup")
+        _compile_custom_patterns(tuple(range(len(_CUSTOM_PATTERNS))))
+    
+    def _iter_regex_entities(self, text: str) -> Iterator[Dict[str, str]]:
+        """
+        Extract entities using regex patterns (backup method).
+        
+        This method provides regex-based extraction for entities that might
+        be missed by spaCy's NER.
+        
+        Args:
+            text (str): Input text to analyze.
+        
+        Yields:
+            Dict[str, str]: Each extracted entity with type and value.
+        """
+        if _REGEX_SET is not None and text.isascii():
+            # One pass over the text finds the patterns worth running
+            # (Match() returns None rather than an empty list)
+            matched = _REGEX_SET.Match(text) or ()
+            candidates = [_REGEX_ENTITIES[i] for i in sorted(matched)]
+        else:
+            # Non-ASCII text needs re's Unicode-aware \b and \d
+            has_digit = _DIGIT_RX.search(text) is not None
+            candidates = [
+                (entity_type, pattern) for entity_type, pattern in _UNICODE_REGEX_ENTITIES
+                if has_digit or entity_type not in _NUMERIC_ENTITIES
+            ]
+        
+        for entity_type, pattern in candidates:
+            if entity_type == 'HASH':
+                yield from self._iter_hash_entities(pattern, text)
+                continue
+            
+            for match in pattern.finditer(text):
+                yield {
+                    'type': entity_type,
+                    'value': match.group(0),
+                    'start': match.start(),
+                    'end': match.end()
+                }
+    
+    @staticmethod
+    def _iter_hash_entities(pattern: re.Pattern, text: str) -> Iterator[Dict[str, str]]:
+        """
+        Split the matches of the fused hash pattern by digest length.
+        
+        Hashes are yielded grouped by type (MD5, then SHA-1, then SHA-256),
+        in text order within each type.
+        
+        Args:
+            pattern (re.Pattern): Compiled hash pattern.
+            text (str): Input text to analyze.
+        
+        Yields:
+            Dict[str, str]: Each hash with its type and value.
+        """
+        by_type: Dict[str, List[Dict[str, str]]] = {
+            entity_type: [] for entity_type in _HASH_TYPES.values()
+        }
+        
+        for match in pattern.finditer(text):
+            start, end = match.span()
+            by_type[_HASH_TYPES[end - start]].append({
+                'type': _HASH_TYPES[end - start],
+                'value': match.group(0),
+                'start': start,
+                'end': end
+            })
+        
+        for hashes in by_type.values():
+            yield from hashes
+    
+    def _prepare_text(self, text: str) -> str:
+        """
+        Truncate oversized input before it is handed to spaCy.
+        
+        Args:
+            text (str): Raw input text.
+        
+        Returns:
+            str: Text limited to the maximum processing length.
+        """
+        # Limit text length to avoid performance issues
+        max_length = 1000000  # 1MB
+        if len(text) > max_length:
+            text = text[:max_length]
+            if self.verbose:
+                console.print(f"[yellow]Warning: Text truncated to {max_length} chars[/yellow]")
+        
+        return text
+    
+    def _cache_path(self, text: str) -> Optional[Path]:
+        """
+        Locate the cache entry for a text.
+        
+        The key covers the model (name and version), the disabled components
+        and the pattern and scoring tables as well as the content, since any
+        of them changes what extraction finds.
+        
+        Args:
+            text (str): Raw text to be analyzed.
+        
+        Returns:
+            Optional[Path]: Entry file, or None when caching is disabled.
+        """
+        if self.cache_dir is None:
+            return None
+        
+        digest = hashlib.blake2b(digest_size=16)
+        salt = (
+            _EXTRACTION_FINGERPRINT,
+            self.model,
+            self.nlp.meta.get('version', ''),
+            *self.disabled,
+            '',
+        )
+        digest.update('\0'.join(salt).encode('utf-8'))
+        digest.update(text.encode('utf-8', 'surrogatepass'))
+        return self.cache_dir / f"{digest.hexdigest()}.json"
+    
+    def _cache_load(self, path: Optional[Path], source: str) -> Optional[List[Dict[str, any]]]:
+        """
+        Return cached entities for a text, attributed to source.
+        
+        Args:
+            path (Optional[Path]): Entry file from _cache_path().
+            source (str): Source identifier for provenance tracking.
+        
+        Returns:
+            Optional[List[Dict[str, any]]]: Fresh entity dicts, or None on a miss.
+        """
+        if path is None:
+            return None
+        
+        try:
+            cached = _read_cache_entry(path)
+        except (OSError, ValueError):
+            return None  # Missing or unreadable entry
+        
+        if self.verbose:
+            console.print(f"[dim]Using cached entities for {source}[/dim]")
+        
+        return [{**ent, 'source': source} for ent in cached]
+    
+    def _cache_save(self, path: Optional[Path], entities: List[Dict[str, any]]):
+        """
+        Atomically write a cache entry, ignoring filesystem errors.
+        
+        Args:
+            path (Optional[Path]): Entry file from _cache_path().
+            entities (List[Dict[str, any]]): Extraction result to store.
+        """
+        if path is None:
+            return
+        
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent)
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as tmp_file:
+                    json.dump(entities, tmp_file, ensure_ascii=False)
+                os.replace(tmp_path, path)
+            except (OSError, ValueError):
+                os.unlink(tmp_path)
+                raise
+        except (OSError, ValueError) as e:
+            if self.verbose:
+                console.print(f"[yellow]Warning: Could not write NER cache entry: {e}[/yellow]")
+    
+    def _collect_entities(
+        self,
+        chunk_docs: Iterable[Tuple[Doc, int]],
+        text: str,
+        source: str
+    ) -> List[Dict[str, any]]:
+        """
+        Materialize the entities of one text as a list.
+        
+        Args:
+            chunk_docs (Iterable[Tuple[Doc, int]]): spaCy documents for each
+                chunk of text, paired with the chunk's character offset.
+            text (str): Full text the chunks were cut from.
+            source (str): Source identifier for provenance tracking.
+        
+        Returns:
+            List[Dict[str, any]]: Deduplicated, importance-scored entities.
+        """
+        entities = list(self._iter_entities(chunk_docs, text, source))
+        
+        if self.verbose:
+            console.print(f"[dim]Extracted {len(entities)} unique entities from {source}[/dim]")
+        
+        return entities
+    
+    def _iter_entities(
+        self,
+        chunk_docs: Iterable[Tuple[Doc, int]],
+        text: str,
+        source: str
+    ) -> Iterator[Dict[str, any]]:
+        """
+        Combine spaCy NER, custom pattern and regex entities for one text.
+        
+        Args:
+            chunk_docs (Iterable[Tuple[Doc, int]]): spaCy documents for each
+                chunk of text, paired with the chunk's character offset.
+            text (str): Full text the chunks were cut from.
+            source (str): Source identifier for provenance tracking.
+        
+        Yields:
+            Dict[str, any]: Each unique, importance-scored entity.
+        """
+        # Deduplicate as entities are produced: the first (type, value) wins
+        seen = set()
+        
+        # Label string and score per spaCy label ID, resolved once per text;
+        # interning lets equal keys compare their type by identity
+        labels: Dict[int, Tuple[str, float]] = {}
+        
+        # Extract standard NER entities, rebasing offsets onto the full text
+        for doc, offset in chunk_docs:
+            for ent in doc.ents:
+                label = labels.get(ent.label)
+                if label is None:
+                    entity_type = sys.intern(ent.label_)
+                    label = labels[ent.label] = (entity_type, _score_type(entity_type))
+                
+                key = (label[0], ent.text)
+                if key not in seen:
+                    seen.add(key)
+                    yield {
+                        'type': key[0],
+                        'value': key[1],
+                        'start': ent.start_char + offset,
+                        'end': ent.end_char + offset,
+                        'source': source,
+                        'method': 'spacy_ner',
+                        'importance_score': label[1]
+                    }
+        
+        # Extract custom pattern matches in a single pass over the raw text
+        custom_rx = _custom_pattern_rx(text)
+        custom_matches = custom_rx.finditer(text) if custom_rx else ()
+        for match in custom_matches:
+            key = (_CUSTOM_PATTERN_LABELS[match.lastgroup], match.group(0))
+            if key not in seen:
+                seen.add(key)
+                yield {
+                    'type': key[0],
+                    'value': key[1],
+                    'start': match.start(),
+                    'end': match.end(),
+                    'source': source,
+                    'method': 'pattern_match',
+                    'importance_score': _score_type(key[0])
+                }
+        
+        # Extract regex-based entities
+        for ent in self._iter_regex_entities(text):
+            key = (ent['type'], ent['value'])
+            if key not in seen:
+                seen.add(key)
+                ent['source'] = source
+                ent['method'] = 'regex'
+                ent['importance_score'] = _score_type(key[0])
+                yield ent
+    
+    def extract_entities(self, text: str, source: str = "unknown") -> List[Dict[str, any]]:
+        """
+        Extract all entities from text using spaCy NER and custom patterns.
+        
+        This is the main entity extraction method combining:
+        - spaCy's built-in NER
+        - Custom pattern matching
+        - Regex-based extraction
+        
+        Results are cached by content hash, so text seen in an earlier run
+        skips the NER pass entirely.
+        
+        Args:
+            text (str): Input text to analyze.
+            source (str): Source identifier for provenance tracking.
+        
+        Returns:
+            List[Dict[str, any]]: List of extracted entities with metadata.
+        """
+        if not text or len(text.strip()) == 0:
+            return []
+        
+        cache_path = self._cache_path(text)
+        entities = self._cache_load(cache_path, source)
+        if entities is not None:
+            return entities
+        
+        text = self._prepare_text(text)
+        entities = self._collect_entities(self._pipe_chunks(text), text, source)
+        self._cache_save(cache_path, entities)
+        
+        return entities
+    
+    def iter_entities(self, text: str, source: str = "unknown") -> Iterator[Dict[str, any]]:
+        """
+        Lazily extract entities from text, yielding each as soon as it is found.
+        
+        Yields the same entities as extract_entities(), in the same order,
+        without holding the full result list in memory.
+        
+        Args:
+            text (str): Input text to analyze.
+            source (str): Source identifier for provenance tracking.
+        
+        Yields:
+            Dict[str, any]: Each extracted entity with metadata.
+        """
+        if not text or len(text.strip()) == 0:
+            return
+        
+        text = self._prepare_text(text)
+        
+        yield from self._iter_entities(self._pipe_chunks(text), text, source)
+    
+    def _pipe_chunks(self, text: str) -> Iterator[Tuple[Doc, int]]:
+        """
+        Run the spaCy pipeline over the chunks of one text.
+        
+        Args:
+            text (str): Prepared text to analyze.
+        
+        Returns:
+            Iterator[Tuple[Doc, int]]: Each chunk's document and character offset.
+        """
+        return self.nlp.pipe(
+            _iter_chunks(text),
+            as_tuples=True,
+            batch_size=_MIN_BATCH_SIZE,
+            n_process=1,
+            disable=self.disabled
+        )
+    
+    def extract_entities_batch(
+        self,
+        items: Iterable[Tuple[str, str]],
+        batch_size: int = 64
+    ) -> List[List[Dict[str, any]]]:
+        """
+        Extract entities from many texts, batching them through spaCy.
+        
+        Uses nlp.pipe() so pipeline dispatch is amortized across documents
+        instead of paid once per text. Large texts are split into chunks,
+        and texts with a cached result are not sent to spaCy at all.
+        
+        Args:
+            items (Iterable[Tuple[str, str]]): (text, source) pairs to analyze.
+            batch_size (int): Number of chunks per spaCy batch (at least
+                _MIN_BATCH_SIZE). Always single-process; parallelism is left
+                to the caller.
+        
+        Returns:
+            List[List[Dict[str, any]]]: Entities for each input, in input order.
+        """
+        items = list(items)
+        results: List[List[Dict[str, any]]] = [[] for _ in items]
+        
+        texts: Dict[int, str] = {}
+        cache_paths: Dict[int, Optional[Path]] = {}
+        for i, (text, source) in enumerate(items):
+            if not text or not text.strip():
+                continue
+            
+            cache_path = self._cache_path(text)
+            cached = self._cache_load(cache_path, source)
+            if cached is not None:
+                results[i] = cached
+            else:
+                texts[i] = self._prepare_text(text)
+                cache_paths[i] = cache_path
+        
+        chunks = (
+            (chunk, (i, offset))
+            for i, text in texts.items()
+            for chunk, offset in _iter_chunks(text)
+        )
+        
+        docs = self.nlp.pipe(
+            chunks,
+            as_tuples=True,
+            batch_size=max(batch_size, _MIN_BATCH_SIZE),
+            n_process=1,
+            disable=self.disabled
+        )
+        # Chunks come back in order, so each text's chunks are contiguous
+        for i, group in groupby(docs, key=lambda item: item[1][0]):
+            chunk_docs = ((doc, offset) for doc, (_, offset) in group)
+            results[i] = self._collect_entities(chunk_docs, texts[i], items[i][1])
+            self._cache_save(cache_paths[i], results[i])
+        
+        return results
+    
+    def analyze_sentiment(self, text: str) -> Dict[str, float]:
+        """
+        Perform basic sentiment analysis on text.
+        
+        This is a placeholder for sentiment analysis. For production use,
+        integrate libraries like VADER, TextBlob, or transformers.
+        
+        Args:
+            text (str): Text to analyze.
+        
+        Returns:
+            Dict[str, float]: Sentiment scores (positive, neutral, negative).
+        """
+        # Placeholder implementation
+        # In production, use VADER or similar
+        return {
+            'positive': 0.0,
+            'neutral': 1.0,
+            'negative': 0.0,
+            'compound': 0.0
+        }
+    
+    def extract_relationships(
+        self,
+        entities: List[Dict[str, any]]
+    ) -> List[Tuple[Dict, Dict, str]]:
+        """
+        Extract relationships between entities.
+        
+        Identifies potential connections between discovered entities
+        based on co-occurrence and context.
+        
+        Args:
+            entities (List[Dict]): List of extracted entities.
+        
+        Returns:
+            List[Tuple]: List of (entity1, entity2, relationship_type) tuples.
+        """
+        relationships = []
+        
+        # Simple co-occurrence based relationship detection
+        # Group entities by source
+        by_source = {}
+        for ent in entities:
+            source = ent.get('source', 'unknown')
+            if source not in by_source:
+                by_source[source] = []
+            by_source[source].append(ent)
+        
+        # Find relationships within same source (entities close in text)
+        for source_entities in by_source.values():
+            starts = np.fromiter(
+                (ent.get('start', 0) for ent in source_entities),
+                dtype=np.int64,
+                count=len(source_entities)
+            )
+            i_idx, j_idx = _close_pairs(starts, 1000)
+            relationships.extend(
+                (source_entities[i], source_entities[j], 'co_occurrence')
+                for i, j in zip(i_idx.tolist(), j_idx.tolist())
+            )
+        
+        return relationships
+    
+    def score_entity_importance(self, entity: Dict[str, any]) -> float:
+        """
+        Calculate an importance score for an entity.
+        
+        Higher scores indicate entities more likely to be relevant for CTF.
+        
+        Args:
+            entity (Dict): Entity to score.
+        
+        Returns:
+            float: Importance score (0.0 to 1.0).
+        """
+        return _score_type(entity.get('type', ''))
+    
+    @staticmethod
+    def score_batch(type_ids: np.ndarray) -> np.ndarray:
+        """
+        Score many entities at once from their EntityType IDs.
+        
+        Args:
+            type_ids (np.ndarray): Integer type IDs, as from config.TYPE_FROM_STR
+                (len(EntityType) for types outside the enum).
+        
+        Returns:
+            np.ndarray: Importance scores, matching score_entity_importance().
+        """
+        return _IMPORTANCE_TABLE[type_ids]
+    
+    def iter_filtered(
+        self,
+        entities: Iterable[Dict[str, any]],
+        min_score: float = 0.3
+    ) -> Iterator[Dict[str, any]]:
+        """
+        Lazily yield the entities scoring at least min_score.
+        
+        Args:
+            entities (Iterable[Dict]): Entities to filter, e.g. from iter_entities().
+            min_score (float): Minimum importance score threshold.
+        
+        Yields:
+            Dict: Each entity above threshold.
+        """
+        for entity in entities:
+            # Entities from extract_entities() are already scored
+            score = entity.get('importance_score')
+            if score is None:
+                score = entity['importance_score'] = self.score_entity_importance(entity)
+            
+            if score >= min_score:
+                yield entity
+    
+    def filter_noise(
+        self,
+        entities: Iterable[Dict[str, any]],
+        min_score: float = 0.3
+    ) -> List[Dict[str, any]]:
+        """
+        Filter out low-value entities (noise reduction).
+        
+        When every entity already carries its importance_score (as
+        extract_entities() output does), all scores are compared against the
+        threshold in one NumPy operation; otherwise entities are scored and
+        filtered one at a time.
+        
+        Args:
+            entities (Iterable[Dict]): Entities to filter.
+            min_score (float): Minimum importance score threshold.
+        
+        Returns:
+            List[Dict]: Filtered entities above threshold.
+        """
+        entities = list(entities)
+        
+        try:
+            scores = np.fromiter(
+                map(itemgetter('importance_score'), entities),
+                dtype=np.float64, count=len(entities)
+            )
+        except (KeyError, TypeError):
+            # Some entities are unscored
+            filtered = list(self.iter_filtered(entities, min_score))
+        else:
+            filtered = list(compress(entities, (scores >= min_score).tolist()))
+        
+        if self.verbose:
+            removed = len(entities) - len(filtered)
+            console.print(f"[dim]Filtered out {removed} low-value entities[/dim]")
+        
+        return filtered
+
+
+# Parser owned by a worker process, created once by _init_worker
+_worker_parser: Optional[AIParser] = None
+
+
+def _init_worker(
+    verbose: bool = False,
+    cache_dir: Optional[Path] = _NER_CACHE_DIR,
+    model: str = SPACY_MODEL,
+    gpu: bool = False
+) -> None:
+    """
+    Load the spaCy model once in a ProcessPoolExecutor worker.
+    
+    Args:
+        verbose (bool): Enable verbose output in the worker's parser.
+        cache_dir (Optional[Path]): NER cache directory, or None to disable it.
+        model (str): spaCy model name or alias to load.
+        gpu (bool): Run the worker's pipeline on the GPU if one is usable.
+    """
+    global _worker_parser
+    _worker_parser = AIParser(model=model, verbose=verbose, cache_dir=cache_dir, gpu=gpu)
+
+
+def _extract_one(item: Tuple[str, str]) -> List[Dict[str, any]]:
+    """
+    Extract entities from one (source, content) pair in a worker process.
+    
+    Module-level so it can be pickled and sent to the worker.
+    
+    Args:
+        item (Tuple[str, str]): Source name and its raw content.
+    
+    Returns:
+        List[Dict[str, any]]: Entities found in the content.
+    """
+    if _worker_parser is None:
+        _init_worker()
+    
+    source, content = item
+    return _worker_parser.extract_entities(content, source=source)
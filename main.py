@@ -1,241 +1,399 @@
-#!/usr/bin/env python3
-"""
-CTF Sentinel - Main CLI Interface
-
-This is the entry point for the CTF OSINT tool. It handles command-line arguments,
-orchestrates the data collection and AI analysis pipeline, and displays results.
-
-Author: CTF Sentinel Team
-Version: 1.0.0
-"""
-
-import argparse
-import sys
-from typing import Dict, Any
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-from rich.table import Table
-from rich import print as rprint
-
-from collection_engine import CollectionEngine
-from ai_parser import AIParser
-from correlation_report import CorrelationEngine, ReportGenerator
-
-# Initialize Rich console for beautiful output
-console = Console()
-
-# Supported target types
-SUPPORTED_TARGETS = ['domain', 'ip', 'alias', 'hash', 'email', 'filename']
-
-
-def parse_arguments() -> argparse.Namespace:
-    """
-    Parse and validate command-line arguments.
-    
-    Returns:
-        argparse.Namespace: Parsed arguments containing target_type and value.
-    
-    Raises:
-        SystemExit: If arguments are invalid or missing.
-    """
-    parser = argparse.ArgumentParser(
-        description='CTF Sentinel - AI-Enhanced OSINT Tool for CTF Competitions',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  python main.py --target-type domain --value example.com
-  python main.py --target-type alias --value johnny_ctf
-  python main.py --target-type email --value suspect@example.com
-  python main.py --target-type ip --value 192.168.1.1
-  python main.py --target-type hash --value 5d41402abc4b2a76b9719d911017c592
-  python main.py --target-type filename --value suspect.jpg
-        """
-    )
-    
-    parser.add_argument(
-        '--target-type',
-        type=str,
-        required=True,
-        choices=SUPPORTED_TARGETS,
-        help=f'Type of target to investigate ({", ".join(SUPPORTED_TARGETS)})'
-    )
-    
-    parser.add_argument(
-        '--value',
-        type=str,
-        required=True,
-        help='Target value to investigate (e.g., domain name, IP address, username)'
-    )
-    
-    parser.add_argument(
-        '--output',
-        type=str,
-        default=None,
-        help='Optional: Save results to file (JSON format)'
-    )
-    
-    parser.add_argument(
-        '--verbose',
-        action='store_true',
-        help='Enable verbose output for debugging'
-    )
-    
-    parser.add_argument(
-        '--skip-ai',
-        action='store_true',
-        help='Skip AI/NER analysis (faster but less intelligent)'
-    )
-    
-    return parser.parse_args()
-
-
-def display_banner():
-    """Display the CTF Sentinel banner."""
-    banner = """
-    ╔═══════════════════════════════════════════════════════════╗
-    ║                                                           ║
-    ║              🔍 CTF SENTINEL 🔍                           ║
-    ║         AI-Enhanced OSINT for CTF Competitions            ║
-    ║                                                           ║
-    ║  Speed • Intelligence • Correlation • Flag Detection      ║
-    ║                                                           ║
-    ╚═══════════════════════════════════════════════════════════╝
-    """
-    console.print(Panel(banner, style="bold cyan", border_style="bright_blue"))
-
-
-def main():
-    """
-    Main execution flow.
-    
-    Orchestrates the entire OSINT pipeline:
-    1. Parse CLI arguments
-    2. Collect data from external tools
-    3. Apply AI/NER analysis
-    4. Correlate findings
-    5. Generate and display report
-    """
-    # Display banner
-    display_banner()
-    
-    # Parse arguments
-    args = parse_arguments()
-    
-    # Display target information
-    console.print(f"\n[bold yellow]Target Type:[/bold yellow] {args.target_type}")
-    console.print(f"[bold yellow]Target Value:[/bold yellow] {args.value}\n")
-    
-    try:
-        # Initialize engines
-        collection_engine = CollectionEngine(verbose=args.verbose)
-        correlation_engine = CorrelationEngine()
-        report_generator = ReportGenerator()
-        
-        # Step 1: Data Collection
-        console.print("[bold green]═══ Phase 1: Data Collection ═══[/bold green]\n")
-        
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            console=console
-        ) as progress:
-            collection_task = progress.add_task(
-                "[cyan]Gathering intelligence from external tools...",
-                total=100
-            )
-            
-            # Collect data based on target type
-            raw_data = collection_engine.collect(
-                target_type=args.target_type,
-                target_value=args.value,
-                progress_callback=lambda p: progress.update(collection_task, completed=p)
-            )
-            
-            progress.update(collection_task, completed=100)
-        
-        console.print(f"[green]✓[/green] Collected {len(raw_data)} data sources\n")
-        
-        # Step 2: AI Analysis (if not skipped)
-        parsed_entities = {}
-        
-        if not args.skip_ai:
-            console.print("[bold green]═══ Phase 2: AI/NER Analysis ═══[/bold green]\n")
-            
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                ai_task = progress.add_task(
-                    "[cyan]Applying AI models for entity extraction...",
-                    total=None
-                )
-                
-                # Initialize AI parser
-                ai_parser = AIParser(verbose=args.verbose)
-                
-                # Parse all collected data
-                for source, content in raw_data.items():
-                    entities = ai_parser.extract_entities(content, source)
-                    parsed_entities[source] = entities
-                
-                progress.update(ai_task, completed=100)
-            
-            # Count total entities found
-            total_entities = sum(len(entities) for entities in parsed_entities.values())
-            console.print(f"[green]✓[/green] Extracted {total_entities} entities using AI/NER\n")
-        
-        # Step 3: Correlation
-        console.print("[bold green]═══ Phase 3: Correlation & Analysis ═══[/bold green]\n")
-        
-        with console.status("[cyan]Correlating findings and identifying patterns..."):
-            correlation_engine.add_raw_data(raw_data)
-            
-            if parsed_entities:
-                correlation_engine.add_parsed_entities(parsed_entities)
-            
-            correlation_results = correlation_engine.correlate()
-        
-        console.print(f"[green]✓[/green] Identified {correlation_results['linked_count']} linked entities\n")
-        
-        # Step 4: Generate and Display Report
-        console.print("[bold green]═══ Phase 4: Intelligence Report ═══[/bold green]\n")
-        
-        report_generator.display_report(
-            target_type=args.target_type,
-            target_value=args.value,
-            raw_data=raw_data,
-            entities=parsed_entities,
-            correlation=correlation_results
-        )
-        
-        # Step 5: Save to file (if requested)
-        if args.output:
-            report_generator.save_to_file(
-                filepath=args.output,
-                target_type=args.target_type,
-                target_value=args.value,
-                raw_data=raw_data,
-                entities=parsed_entities,
-                correlation=correlation_results
-            )
-            console.print(f"\n[green]✓[/green] Report saved to: {args.output}")
-        
-        console.print("\n[bold cyan]═══════════════════════════════════════════════════════════[/bold cyan]")
-        console.print("[bold green]✓ Analysis Complete![/bold green]")
-        console.print("[bold cyan]═══════════════════════════════════════════════════════════[/bold cyan]\n")
-        
-    except KeyboardInterrupt:
-        console.print("\n\n[bold red]✗ Operation cancelled by user[/bold red]")
-        sys.exit(1)
-    except Exception as e:
-        console.print(f"\n\n[bold red]✗ Error: {str(e)}[/bold red]")
-        if args.verbose:
-            console.print_exception()
-        sys.exit(1)
-
-
-if __name__ == "__main__":
-    main()
+#!/usr/bin/env python3
+"""
+CTF Sentinel - Main CLI Interface
+
+This is the entry point for the CTF OSINT tool. It handles command-line arguments,
+orchestrates the data collection and AI analysis pipeline, and displays results.
+
+Author: CTF Sentinel Team
+Version: 1.0.0
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Dict, Any, List, Tuple
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+from rich import print as rprint
+
+from config import REPORT_MAX_RELATIONSHIPS, SPACY_MODEL_ALIASES
+
+# The pipeline modules pull in spaCy, NumPy and requests, so they are imported
+# only once arguments are valid; --help and usage errors return immediately
+if TYPE_CHECKING:
+    from rich.progress import Progress
+    from collection_engine import CollectionEngine
+    from correlation_report import CorrelationEngine
+
+# Initialize Rich console for beautiful output
+console = Console()
+
+# Supported target types
+SUPPORTED_TARGETS = ['domain', 'ip', 'alias', 'hash', 'email', 'filename']
+
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parse and validate command-line arguments.
+    
+    Returns:
+        argparse.Namespace: Parsed arguments containing target_type and value.
+    
+    Raises:
+        SystemExit: If arguments are invalid or missing.
+    """
+    parser = argparse.ArgumentParser(
+        description='CTF Sentinel - AI-Enhanced OSINT Tool for CTF Competitions',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python main.py --target-type domain --value example.com
+  python main.py --target-type alias --value johnny_ctf
+  python main.py --target-type email --value suspect@example.com
+  python main.py --target-type ip --value 192.168.1.1
+  python main.py --target-type hash --value 5d41402abc4b2a76b9719d911017c592
+  python main.py --target-type filename --value suspect.jpg
+        """
+    )
+    
+    parser.add_argument(
+        '--target-type',
+        type=str,
+        required=True,
+        choices=SUPPORTED_TARGETS,
+        help=f'Type of target to investigate ({", ".join(SUPPORTED_TARGETS)})'
+    )
+    
+    parser.add_argument(
+        '--value',
+        type=str,
+        required=True,
+        help='Target value to investigate (e.g., domain name, IP address, username)'
+    )
+    
+    parser.add_argument(
+        '--output',
+        type=str,
+        default=None,
+        help='Optional: Save results to file (JSON format)'
+    )
+    
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='Enable verbose output for debugging'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignore cached tool, API and NER output and re-run every lookup'
+    )
+    
+    parser.add_argument(
+        '--skip-ai',
+        action='store_true',
+        help='Skip AI/NER analysis (faster but less intelligent)'
+    )
+    
+    parser.add_argument(
+        '--model',
+        type=str,
+        default='sm',
+        choices=list(SPACY_MODEL_ALIASES),
+        help='spaCy model size: sm is fastest, md and trf trade speed for accuracy'
+    )
+    
+    parser.add_argument(
+        '--gpu',
+        action='store_true',
+        help='Run spaCy on a CUDA GPU if available (most useful with --model trf)'
+    )
+    
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=None,
+        help='Number of AI worker processes, at most one per source '
+             '(default: one per CPU, or 1 with --gpu; 1 runs in-process)'
+    )
+    
+    args = parser.parse_args()
+    
+    if args.jobs is not None and args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+    
+    return args
+
+
+def display_banner():
+    """Display the CTF Sentinel banner."""
+    banner = """
+    ╔═══════════════════════════════════════════════════════════╗
+    ║                                                           ║
+    ║              🔍 CTF SENTINEL 🔍                           ║
+    ║         AI-Enhanced OSINT for CTF Competitions            ║
+    ║                                                           ║
+    ║  Speed • Intelligence • Correlation • Flag Detection      ║
+    ║                                                           ║
+    ╚═══════════════════════════════════════════════════════════╝
+    """
+    console.print(Panel(banner, style="bold cyan", border_style="bright_blue"))
+
+
+def make_progress() -> 'Progress':
+    """
+    Create the progress display shared by every pipeline phase.
+    
+    Returns:
+        Progress: Spinner, description and bar columns on the main console.
+    """
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
+    
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        console=console
+    )
+
+
+def collect_and_extract(
+    collection_engine: 'CollectionEngine',
+    correlation_engine: 'CorrelationEngine',
+    args: argparse.Namespace,
+    progress: 'Progress'
+) -> Tuple[Dict[str, str], Dict[str, List[Dict[str, Any]]]]:
+    """
+    Collect data and extract entities from every source.
+    
+    With more than one worker, collection (I/O bound, on the engine's thread
+    pool) overlaps NER (CPU bound, in worker processes): each source is sent
+    to a worker as soon as it arrives, so the two phases take roughly as long
+    as the slower of them instead of their sum. With a single worker, the
+    sources are collected first and extracted in-process in one nlp.pipe()
+    batch, which avoids loading a second copy of the model.
+    
+    Sources are reported and fed to the correlation engine in job order, not
+    completion order, so the correlation map fills the same way on every run.
+    
+    Args:
+        collection_engine (CollectionEngine): Engine running the external tools.
+        correlation_engine (CorrelationEngine): Engine ingesting the entities.
+        args (argparse.Namespace): Parsed command-line arguments.
+        progress (Progress): Running display to add the two phases' tasks to.
+    
+    Returns:
+        Tuple[Dict[str, str], Dict[str, List[Dict[str, Any]]]]: Raw data and
+            parsed entities, both keyed by source in job order.
+    """
+    from ai_parser import (
+        AIParser, _NER_CACHE_DIR, _extract_one, _init_worker, _require_model
+    )
+    
+    # Workers load the model in their initializer, where a missing model only
+    # surfaces as a BrokenProcessPool; check it here to report it properly
+    model = _require_model(args.model)
+    ner_cache_dir = None if args.no_cache else _NER_CACHE_DIR
+    jobs = collection_engine.jobs_for(args.target_type, args.value)
+    
+    collection_task = progress.add_task(
+        "[cyan]Gathering intelligence from external tools...",
+        total=100
+    )
+    ai_task = progress.add_task(
+        "[cyan]Applying AI models for entity extraction...",
+        total=len(jobs)
+    )
+    collected = collection_engine.iter_jobs(
+        jobs,
+        progress_callback=lambda p: progress.update(collection_task, completed=p)
+    )
+    
+    # A GPU is shared by one worker by default rather than one model copy per
+    # process, and workers beyond one per source would only load idle copies
+    workers = min(args.jobs or (1 if args.gpu else os.cpu_count() or 1), len(jobs))
+    
+    if workers <= 1:
+        outputs = dict(collected)
+        raw_data = {source: outputs[source] for source in jobs}
+        progress.update(collection_task, completed=100)
+        
+        ai_parser = AIParser(
+            model=model,
+            verbose=args.verbose,
+            cache_dir=ner_cache_dir,
+            gpu=args.gpu
+        )
+        
+        # Parse all collected data in a single spaCy batch
+        batch = ai_parser.extract_entities_batch(
+            (content, source) for source, content in raw_data.items()
+        )
+        parsed_entities = dict(zip(raw_data, batch))
+        for source, entities in parsed_entities.items():
+            correlation_engine.ingest(source, entities)
+        
+        progress.update(ai_task, completed=len(raw_data))
+        return raw_data, parsed_entities
+    
+    outputs = {}
+    parsed_entities = {}
+    
+    # Collection threads are still running, so spawn workers rather than fork
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_worker,
+        initargs=(args.verbose, ner_cache_dir, model, args.gpu)
+    ) as executor:
+        futures = {}
+        
+        for source, content in collected:
+            outputs[source] = content
+            futures[source] = executor.submit(_extract_one, (source, content))
+        
+        progress.update(collection_task, completed=100)
+        raw_data = {source: outputs[source] for source in jobs}
+        
+        # Results that finish early wait for the sources ahead of them
+        for source in raw_data:
+            parsed_entities[source] = futures[source].result()
+            correlation_engine.ingest(source, parsed_entities[source])
+            progress.advance(ai_task)
+    
+    return raw_data, parsed_entities
+
+
+def main():
+    """
+    Main execution flow.
+    
+    Orchestrates the entire OSINT pipeline:
+    1. Parse CLI arguments
+    2. Collect data from external tools
+    3. Apply AI/NER analysis (overlapped with collection)
+    4. Correlate findings
+    5. Generate and display report
+    """
+    # Display banner
+    display_banner()
+    
+    # Parse arguments
+    args = parse_arguments()
+    
+    from collection_engine import CollectionEngine
+    from correlation_report import CorrelationEngine, ReportGenerator
+    
+    # Display target information
+    console.print(f"\n[bold yellow]Target Type:[/bold yellow] {args.target_type}")
+    console.print(f"[bold yellow]Target Value:[/bold yellow] {args.value}\n")
+    
+    try:
+        # Initialize engines
+        collection_engine = CollectionEngine(
+            verbose=args.verbose,
+            use_cache=not args.no_cache
+        )
+        correlation_engine = CorrelationEngine()
+        report_generator = ReportGenerator()
+        
+        parsed_entities = {}
+        
+        # One live display carries every phase's tasks until the report is drawn
+        with make_progress() as progress:
+            if args.skip_ai:
+                # Step 1: Data Collection
+                console.print("[bold green]═══ Phase 1: Data Collection ═══[/bold green]\n")
+                
+                collection_task = progress.add_task(
+                    "[cyan]Gathering intelligence from external tools...",
+                    total=100
+                )
+                
+                # Collect data based on target type
+                raw_data = collection_engine.collect(
+                    target_type=args.target_type,
+                    target_value=args.value,
+                    progress_callback=lambda p: progress.update(collection_task, completed=p)
+                )
+                
+                progress.update(collection_task, completed=100)
+            else:
+                # Steps 1 and 2: Data Collection overlapped with AI Analysis
+                console.print("[bold green]═══ Phase 1-2: Data Collection & AI/NER Analysis ═══[/bold green]\n")
+                
+                raw_data, parsed_entities = collect_and_extract(
+                    collection_engine, correlation_engine, args, progress
+                )
+            
+            console.print(f"[green]✓[/green] Collected {len(raw_data)} data sources\n")
+            
+            if not args.skip_ai:
+                # Count total entities found
+                total_entities = sum(len(entities) for entities in parsed_entities.values())
+                console.print(f"[green]✓[/green] Extracted {total_entities} entities using AI/NER\n")
+            
+            # Step 3: Correlation
+            console.print("[bold green]═══ Phase 3: Correlation & Analysis ═══[/bold green]\n")
+            
+            correlation_task = progress.add_task(
+                "[cyan]Correlating findings and identifying patterns...",
+                total=None
+            )
+            
+            # Parsed entities were already ingested as extraction finished
+            correlation_engine.add_raw_data(raw_data)
+            
+            # The saved report lists every relationship; the display only the top few
+            correlation_results = correlation_engine.correlate(
+                keep_top_relationships=None if args.output else REPORT_MAX_RELATIONSHIPS
+            )
+            
+            progress.update(correlation_task, total=1, completed=1)
+        
+        console.print(f"[green]✓[/green] Identified {correlation_results['linked_count']} linked entities\n")
+        
+        # Step 4: Generate and Display Report
+        console.print("[bold green]═══ Phase 4: Intelligence Report ═══[/bold green]\n")
+        
+        report_generator.display_report(
+            target_type=args.target_type,
+            target_value=args.value,
+            raw_data=raw_data,
+            entities=parsed_entities,
+            correlation=correlation_results
+        )
+        
+        # Step 5: Save to file (if requested)
+        if args.output:
+            report_generator.save_to_file(
+                filepath=args.output,
+                target_type=args.target_type,
+                target_value=args.value,
+                raw_data=raw_data,
+                entities=parsed_entities,
+                correlation=correlation_results
+            )
+            console.print(f"\n[green]✓[/green] Report saved to: {args.output}")
+        
+        console.print("\n[bold cyan]═══════════════════════════════════════════════════════════[/bold cyan]")
+        console.print("[bold green]✓ Analysis Complete![/bold green]")
+        console.print("[bold cyan]═══════════════════════════════════════════════════════════[/bold cyan]\n")
+        
+    except KeyboardInterrupt:
+        console.print("\n\n[bold red]✗ Operation cancelled by user[/bold red]")
+        sys.exit(1)
+    except Exception as e:
+        console.print(f"\n\n[bold red]✗ Error: {str(e)}[/bold red]")
+        if args.verbose:
+            console.print_exception()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
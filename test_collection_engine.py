@@ -0,0 +1,96 @@
+"""
+Unit tests for collection_engine.py module.
+
+Tests concurrent job dispatch without running any external tools.
+"""
+
+import asyncio
+import json
+import time
+from functools import partial
+import pytest
+from collection_engine import CollectionEngine, _dumps
+
+
+@pytest.fixture
+def engine():
+    """Create CollectionEngine instance for testing."""
+    return CollectionEngine(verbose=False, use_cache=False)
+
+
+def _slow_job(delay, output):
+    """Return output after delay seconds, standing in for an external tool."""
+    time.sleep(delay)
+    return output
+
+
+class TestAsyncCollection:
+    """Test collection from asyncio code."""
+    
+    def test_collect_async_returns_job_order(self, engine, monkeypatch):
+        """Test that results keep job order and progress is reported per finished job."""
+        # The first job finishes last, so completion order is the reverse of job order
+        jobs = {
+            'slow': partial(_slow_job, 0.2, 'slow output'),
+            'medium': partial(_slow_job, 0.1, 'medium output'),
+            'fast': partial(_slow_job, 0.0, 'fast output'),
+        }
+        monkeypatch.setattr(engine, '_alias_jobs', lambda alias: dict(jobs))
+        
+        progress = []
+        results = asyncio.run(
+            engine.collect_async('alias', 'johnny_ctf', progress_callback=progress.append)
+        )
+        
+        assert list(results) == ['slow', 'medium', 'fast']
+        assert results['fast'] == 'fast output'
+        assert progress == [33, 66, 100, 100]
+    
+    def test_collect_async_rejects_unknown_target(self, engine):
+        """Test that unsupported target types raise ValueError."""
+        with pytest.raises(ValueError):
+            asyncio.run(engine.collect_async('planet', 'mars'))
+
+
+
+class _FakeResponse:
+    """Minimal stand-in for a successful requests.Response."""
+    
+    status_code = 200
+    
+    def json(self):
+        return {'login': 'johnny_ctf', 'location': 'Zürich'}
+
+
+class TestUncachedLookups:
+    """Test lookups with the disk cache disabled."""
+    
+    def test_run_command_returns_text(self, engine, monkeypatch):
+        """Test that cached tools still return plain text with use_cache=False."""
+        monkeypatch.setattr(engine, '_execute', lambda *args: ('whois output', True))
+        
+        assert engine._run_command(['whois', 'example.com']) == 'whois output'
+    
+    def test_github_helpers_return_text(self, engine, monkeypatch):
+        """Test that GitHub lookups return plain text with use_cache=False."""
+        monkeypatch.setattr(engine.session, 'get', lambda *args, **kwargs: _FakeResponse())
+        
+        for output in (
+            engine._search_github_user('johnny_ctf'),
+            engine._search_github_email('admin@example.com'),
+            engine._search_github_hash('5d41402abc4b2a76b9719d911017c592'),
+        ):
+            assert isinstance(output, str)
+            assert 'johnny_ctf' in output
+    
+    def test_dumps_keeps_non_ascii_text(self):
+        """Test that serialized projections keep non-ASCII characters intact."""
+        data = {'name': 'Zoë', 'location': 'Zürich 🐉', 'public_repos': 3}
+        
+        output = _dumps(data)
+        
+        assert 'Zürich 🐉' in output
+        assert output == json.dumps(data, separators=(',', ':'), ensure_ascii=False)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
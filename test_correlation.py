@@ -1,131 +1,248 @@
-"""
-Unit tests for correlation_report.py module.
-
-Tests entity correlation and relationship mapping logic.
-"""
-
-import pytest
-from correlation_report import CorrelationEngine, ReportGenerator
-
-
-@pytest.fixture
-def engine():
-    """Create CorrelationEngine instance for testing."""
-    return CorrelationEngine()
-
-
-@pytest.fixture
-def sample_entities():
-    """Sample entities for testing."""
-    return {
-        'source1': [
-            {'value': 'admin@example.com', 'type': 'EMAIL', 'source': 'source1'},
-            {'value': '192.168.1.1', 'type': 'IP_ADDRESS', 'source': 'source1'},
-            {'value': 'CTF{test_flag}', 'type': 'CTF_FLAG', 'source': 'source1', 'importance_score': 1.0}
-        ],
-        'source2': [
-            {'value': 'admin@example.com', 'type': 'EMAIL', 'source': 'source2'},
-            {'value': 'johnny_ctf', 'type': 'PERSON', 'source': 'source2'}
-        ]
-    }
-
-
-class TestCorrelationEngine:
-    """Test correlation engine functionality."""
-    
-    def test_add_parsed_entities(self, engine, sample_entities):
-        """Test adding parsed entities to correlation map."""
-        engine.add_parsed_entities(sample_entities)
-        
-        # Check that entities are added
-        assert 'admin@example.com' in engine.correlation_map
-        assert '192.168.1.1' in engine.correlation_map
-        assert 'ctf{test_flag}' in engine.correlation_map
-    
-    def test_entity_source_tracking(self, engine, sample_entities):
-        """Test that entity sources are tracked correctly."""
-        engine.add_parsed_entities(sample_entities)
-        
-        email_data = engine.correlation_map['admin@example.com']
-        assert 'source1' in email_data['sources']
-        assert 'source2' in email_data['sources']
-        assert len(email_data['sources']) == 2
-    
-    def test_correlation_links_entities(self, engine, sample_entities):
-        """Test that correlation finds entity links."""
-        engine.add_parsed_entities(sample_entities)
-        results = engine.correlate()
-        
-        # Email appears in both sources, should be linked
-        assert results['linked_count'] > 0
-    
-    def test_identify_ctf_flags(self, engine, sample_entities):
-        """Test identification of CTF flags."""
-        engine.add_parsed_entities(sample_entities)
-        results = engine.correlate()
-        
-        assert len(results['ctf_flags']) == 1
-        assert 'ctf{test_flag}' in results['ctf_flags']
-    
-    def test_correlation_statistics(self, engine, sample_entities):
-        """Test correlation statistics calculation."""
-        engine.add_parsed_entities(sample_entities)
-        results = engine.correlate()
-        
-        assert 'total_entities' in results
-        assert 'linked_count' in results
-        assert 'high_value_count' in results
-        assert results['total_entities'] > 0
-
-
-class TestKeyNormalization:
-    """Test entity key normalization."""
-    
-    def test_case_insensitive_matching(self, engine):
-        """Test that entity keys are case-insensitive."""
-        entities1 = {
-            'source1': [{'value': 'Admin@Example.COM', 'type': 'EMAIL', 'source': 'source1'}]
-        }
-        entities2 = {
-            'source2': [{'value': 'admin@example.com', 'type': 'EMAIL', 'source': 'source2'}]
-        }
-        
-        engine.add_parsed_entities(entities1)
-        engine.add_parsed_entities(entities2)
-        
-        # Both should map to same normalized key
-        email_data = engine.correlation_map['admin@example.com']
-        assert len(email_data['sources']) == 2
-
-
-class TestRelationshipDetection:
-    """Test relationship detection between entities."""
-    
-    def test_co_occurrence_relationships(self, engine):
-        """Test co-occurrence relationship detection."""
-        entities = {
-            'source1': [
-                {'value': 'user@example.com', 'type': 'EMAIL', 'source': 'source1'},
-                {'value': '192.168.1.1', 'type': 'IP_ADDRESS', 'source': 'source1'}
-            ]
-        }
-        
-        engine.add_parsed_entities(entities)
-        results = engine.correlate()
-        
-        # Entities from same source should have relationship
-        assert len(results['relationships']) > 0
-
-
-class TestReportGenerator:
-    """Test report generation."""
-    
-    def test_report_generator_initialization(self):
-        """Test report generator can be initialized."""
-        generator = ReportGenerator()
-        assert generator is not None
-        assert generator.console is not None
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+"""
+Unit tests for correlation_report.py module.
+
+Tests entity correlation and relationship mapping logic.
+"""
+
+import json
+import pytest
+from correlation_report import CorrelationEngine, ReportGenerator
+
+
+@pytest.fixture
+def engine():
+    """Create CorrelationEngine instance for testing."""
+    return CorrelationEngine()
+
+
+@pytest.fixture
+def sample_entities():
+    """Sample entities for testing."""
+    return {
+        'source1': [
+            {'value': 'admin@example.com', 'type': 'EMAIL', 'source': 'source1'},
+            {'value': '192.168.1.1', 'type': 'IP_ADDRESS', 'source': 'source1'},
+            {'value': 'CTF{test_flag}', 'type': 'CTF_FLAG', 'source': 'source1', 'importance_score': 1.0}
+        ],
+        'source2': [
+            {'value': 'admin@example.com', 'type': 'EMAIL', 'source': 'source2'},
+            {'value': 'johnny_ctf', 'type': 'PERSON', 'source': 'source2'}
+        ]
+    }
+
+
+class TestCorrelationEngine:
+    """Test correlation engine functionality."""
+    
+    def test_add_parsed_entities(self, engine, sample_entities):
+        """Test adding parsed entities to correlation map."""
+        engine.add_parsed_entities(sample_entities)
+        
+        # Check that entities are added
+        assert 'admin@example.com' in engine.correlation_map
+        assert '192.168.1.1' in engine.correlation_map
+        assert 'ctf{test_flag}' in engine.correlation_map
+    
+    def test_entity_source_tracking(self, engine, sample_entities):
+        """Test that entity sources are tracked correctly."""
+        engine.add_parsed_entities(sample_entities)
+        
+        email_data = engine.correlation_map['admin@example.com']
+        assert 'source1' in email_data['sources']
+        assert 'source2' in email_data['sources']
+        assert len(email_data['sources']) == 2
+    
+    def test_correlation_links_entities(self, engine, sample_entities):
+        """Test that correlation finds entity links."""
+        engine.add_parsed_entities(sample_entities)
+        results = engine.correlate()
+        
+        # Email appears in both sources, should be linked
+        assert results['linked_count'] > 0
+    
+    def test_identify_ctf_flags(self, engine, sample_entities):
+        """Test identification of CTF flags."""
+        engine.add_parsed_entities(sample_entities)
+        results = engine.correlate()
+        
+        assert len(results['ctf_flags']) == 1
+        assert 'ctf{test_flag}' in results['ctf_flags']
+    
+    def test_correlation_statistics(self, engine, sample_entities):
+        """Test correlation statistics calculation."""
+        engine.add_parsed_entities(sample_entities)
+        results = engine.correlate()
+        
+        assert 'total_entities' in results
+        assert 'linked_count' in results
+        assert 'high_value_count' in results
+        assert results['total_entities'] > 0
+    
+    def test_ingest_matches_add_parsed_entities(self, engine, sample_entities):
+        """Ingesting sources one at a time should build the same correlation."""
+        engine.add_parsed_entities(sample_entities)
+        
+        streamed = CorrelationEngine()
+        for source, entities in sample_entities.items():
+            streamed.ingest(source, iter(entities))
+        
+        assert streamed.correlation_map == engine.correlation_map
+        assert streamed.correlate() == engine.correlate()
+    
+    def test_vectorized_scores_match_scalar(self, engine, sample_entities):
+        """NumPy scoring should produce the same scores as the scalar loop."""
+        engine.add_parsed_entities(sample_entities)
+        engine.correlate()
+        scalar = {k: v['final_score'] for k, v in engine.correlation_map.items()}
+        
+        engine._calculate_entity_scores_vectorized()
+        vectorized = {k: v['final_score'] for k, v in engine.correlation_map.items()}
+        
+        assert vectorized == scalar
+    
+    def test_vectorized_links_match_scalar(self, sample_entities):
+        """NumPy linking should produce the same relationships as the scalar loop."""
+        reference = CorrelationEngine()
+        reference.add_parsed_entities(sample_entities)
+        reference._find_entity_links()
+        
+        engine = CorrelationEngine()
+        engine.add_parsed_entities(sample_entities)
+        engine._find_entity_links_vectorized()
+        
+        assert engine.relationships == reference.relationships
+        assert engine.relationship_count == reference.relationship_count
+        links = {k: v.link_count for k, v in engine.correlation_map.items()}
+        assert links == {k: v.link_count for k, v in reference.correlation_map.items()}
+    
+    def test_vectorized_summary_matches_scalar(self, engine, sample_entities):
+        """Column-wise statistics should match the scalar pass."""
+        engine.add_parsed_entities(sample_entities)
+        engine._find_entity_links()
+        
+        assert engine._summarize_vectorized() == engine._summarize()
+
+
+class TestKeyNormalization:
+    """Test entity key normalization."""
+    
+    def test_case_insensitive_matching(self, engine):
+        """Test that entity keys are case-insensitive."""
+        entities1 = {
+            'source1': [{'value': 'Admin@Example.COM', 'type': 'EMAIL', 'source': 'source1'}]
+        }
+        entities2 = {
+            'source2': [{'value': 'admin@example.com', 'type': 'EMAIL', 'source': 'source2'}]
+        }
+        
+        engine.add_parsed_entities(entities1)
+        engine.add_parsed_entities(entities2)
+        
+        # Both should map to same normalized key
+        email_data = engine.correlation_map['admin@example.com']
+        assert len(email_data['sources']) == 2
+    
+    def test_unicode_case_folding(self, engine):
+        """Test that keys match across Unicode case variants, not just ASCII."""
+        engine.add_parsed_entities({
+            'source1': [{'value': 'Straße.example', 'type': 'SUBDOMAIN', 'source': 'source1'}],
+            'source2': [{'value': 'STRASSE.EXAMPLE', 'type': 'SUBDOMAIN', 'source': 'source2'}]
+        })
+        
+        assert list(engine.correlation_map) == ['strasse.example']
+        assert engine.correlation_map['strasse.example']['sources'] == {'source1', 'source2'}
+
+
+class TestRelationshipDetection:
+    """Test relationship detection between entities."""
+    
+    def test_co_occurrence_relationships(self, engine):
+        """Test co-occurrence relationship detection."""
+        entities = {
+            'source1': [
+                {'value': 'user@example.com', 'type': 'EMAIL', 'source': 'source1'},
+                {'value': '192.168.1.1', 'type': 'IP_ADDRESS', 'source': 'source1'}
+            ]
+        }
+        
+        engine.add_parsed_entities(entities)
+        results = engine.correlate()
+        
+        # Entities from same source should have relationship
+        assert len(results['relationships']) > 0
+    
+    def test_keep_top_relationships(self, engine, sample_entities):
+        """Bounded correlation should keep the strongest records and the full count."""
+        engine.add_parsed_entities(sample_entities)
+        results = engine.correlate(keep_top_relationships=1)
+        
+        assert results['relationship_count'] == 4
+        assert len(results['relationships']) == 1
+        assert results['linked_count'] == 4
+    
+    def test_one_relationship_per_pair_across_sources(self, engine):
+        """A pair sharing several sources should yield a single aggregated record."""
+        entities = {
+            source: [
+                {'value': 'user@example.com', 'type': 'EMAIL', 'source': source},
+                {'value': '192.168.1.1', 'type': 'IP_ADDRESS', 'source': source}
+            ]
+            for source in ('source1', 'source2')
+        }
+        
+        engine.add_parsed_entities(entities)
+        results = engine.correlate()
+        
+        assert len(results['relationships']) == 1
+        relationship = results['relationships'][0]
+        assert relationship['strength'] == 2
+        assert sorted(relationship['sources']) == ['source1', 'source2']
+    
+    def test_no_relationship_without_shared_source(self, engine):
+        """Entities that never share a source should not be linked."""
+        entities = {
+            'source1': [{'value': 'user@example.com', 'type': 'EMAIL', 'source': 'source1'}],
+            'source2': [{'value': '192.168.1.1', 'type': 'IP_ADDRESS', 'source': 'source2'}]
+        }
+        
+        engine.add_parsed_entities(entities)
+        results = engine.correlate()
+        
+        assert results['relationships'] == []
+        assert results['linked_count'] == 0
+
+
+class TestReportGenerator:
+    """Test report generation."""
+    
+    def test_report_generator_initialization(self):
+        """Test report generator can be initialized."""
+        generator = ReportGenerator()
+        assert generator is not None
+        assert generator.console is not None
+    
+    def test_save_to_file_writes_entities_without_offsets(self, tmp_path, engine, sample_entities):
+        """Saved reports should be valid JSON with entity offsets stripped."""
+        entities = {
+            source: [dict(ent, start=0, end=1) for ent in ents]
+            for source, ents in sample_entities.items()
+        }
+        engine.add_parsed_entities(entities)
+        correlation = engine.correlate()
+        output = tmp_path / "report.json"
+        
+        ReportGenerator().save_to_file(
+            str(output), 'domain', 'example.com',
+            {'source1': 'raw', 'source2': ''}, entities, correlation
+        )
+        
+        report = json.loads(output.read_text(encoding='utf-8'))
+        assert report['summary']['total_entities'] == correlation['total_entities']
+        assert report['entities']['source2'][1] == {
+            'value': 'johnny_ctf', 'type': 'PERSON', 'source': 'source2'
+        }
+        assert report['sources']['source2']['preview'] is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])